@@ -6,7 +6,11 @@ import functools
 try:
     lru_cache = functools.lru_cache
 except AttributeError:
+    HAS_LRU_CACHE = False
+
     def lru_cache(maxsize=None):    # Noop.
         def _decorator(f):
             return f
         return _decorator
+else:
+    HAS_LRU_CACHE = True
@@ -0,0 +1,9 @@
+from __future__ import absolute_import
+
+
+try:
+    from html import unescape
+except ImportError:     # Python 2.
+    from HTMLParser import HTMLParser
+    unescape = HTMLParser().unescape
+    del HTMLParser
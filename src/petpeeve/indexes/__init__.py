@@ -34,6 +34,9 @@ class JSONEnabledIndex(object):
         logger.debug('Trying to download an artifact for inspection...')
         return self.simple.get_dependencies(candidate, offline=False)
 
+    def prefetch(self, packages):
+        self.simple.prefetch(packages)
+
     def get_candidates(self, requirement):
         try:
             return self.legacy_json.get_candidates(requirement)
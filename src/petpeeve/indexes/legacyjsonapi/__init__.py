@@ -1,6 +1,5 @@
 import posixpath
 
-from pip._vendor import requests
 from pip._vendor.packaging.version import parse as parse_version
 
 from petpeeve._compat.functools import lru_cache
@@ -8,6 +7,7 @@ from petpeeve.candidates import Candidate
 from petpeeve.requirements import RequirementSpecification
 
 from ..exceptions import APIError, PackageNotFound, VersionNotFound
+from ..sessions import get_session
 
 
 # Should be reasonable?
@@ -19,12 +19,13 @@ class IndexServer(object):
 
     def __init__(self, base_url):
         self.base_url = base_url
+        self._session = get_session()
 
     def _get(self, *parts):
         """Access an API endpoint.
         """
         url = posixpath.join(posixpath.join(self.base_url, *parts), 'json')
-        response = requests.get(url)
+        response = self._session.get(url)
         return response
 
     @lru_cache(maxsize=PYPI_VERSION_CACHE_SIZE)
@@ -0,0 +1,26 @@
+import os
+
+from pip._vendor import requests
+from pip._vendor.cachecontrol import CacheControl
+
+from petpeeve.pip_internal.download import SafeFileCache
+from petpeeve.pip_internal.utils.appdirs import user_cache_dir
+
+
+HTTP_CACHE_DIR = os.path.join(user_cache_dir('petpeeve'), 'http')
+
+_session = None
+
+
+def get_session():
+    """Get the HTTP session shared by all index servers.
+
+    Responses are cached on disk, so unchanged pages are revalidated with a
+    conditional request instead of downloaded again.
+    """
+    global _session
+    if _session is None:
+        _session = CacheControl(
+            requests.Session(), cache=SafeFileCache(HTTP_CACHE_DIR),
+        )
+    return _session
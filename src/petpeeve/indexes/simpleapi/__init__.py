@@ -1,59 +1,136 @@
+import collections
+import multiprocessing.pool
+import operator
 import posixpath
+import re
 
 from pip._vendor import requests, six
 from pip._vendor.packaging import specifiers as packaging_specifiers
 
-from petpeeve._compat.functools import lru_cache
+from petpeeve._compat.functools import HAS_LRU_CACHE, lru_cache
+from petpeeve._compat.html import unescape
 from petpeeve.candidates import Candidate
-from petpeeve.links import parse_link, UnwantedLink
+from petpeeve.links import parse_link, split_filename, UnwantedLink
 from petpeeve.requirements import RequirementSpecification
 
 from ..exceptions import APIError, PackageNotFound, VersionNotFound
+from ..sessions import get_session
 
 
-class SimplePageParser(six.moves.html_parser.HTMLParser):
-    """Parser to scrap links from a simple API page.
+# Simple API pages are machine-generated and only contain anchors we care
+# about, so scanning for them with a regex is enough (and much faster than a
+# full HTML parser). Comments are matched as well so anchors inside them can
+# be skipped, and quoted attribute values may contain ">".
+_ANCHOR_RE = re.compile(r"""
+    <!--.*?-->
+    |
+    <a\s((?:[^>"']|"[^"]*"|'[^']*')*)>
+""", re.IGNORECASE | re.DOTALL | re.VERBOSE)
+
+_ATTRIBUTE_RE = re.compile(r"""
+    ([^\s"'>/=]+)                                      # Name.
+    (?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?    # Optional value.
+""", re.VERBOSE)
+
+
+# Pages usually only have a handful of distinct data-requires-python values.
+PYTHON_SPECIFIER_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=PYTHON_SPECIFIER_CACHE_SIZE)
+def _parse_python_specifier(value):
+    return packaging_specifiers.SpecifierSet(value)
+
+
+class PageEntry(collections.namedtuple('PageEntry', [
+        'klass', 'url_parts', 'checksum', 'file_stem', 'file_extension',
+        'python_specifier', 'version'])):
+    """An artifact found on a simple API page.
+
+    Building a link parses the whole file name (and checks binary
+    compatibility for wheels), so pages store these lightweight entries
+    instead, and only build links for entries that are actually needed.
     """
-    def __init__(self, base_url):
-        # Can't use super() because HTMLParser was an old-style class.
-        six.moves.html_parser.HTMLParser.__init__(self)
-        self.base_url_parts = six.moves.urllib_parse.urlsplit(base_url)
-        self.links = []
+    __slots__ = ()
+
+    def as_link(self):
+        return self.klass(
+            url=six.moves.urllib_parse.urlunsplit(self.url_parts),
+            checksum=self.checksum,
+            file_stem=self.file_stem,
+            file_extension=self.file_extension,
+            python_specifier=self.python_specifier,
+        )
 
-    def handle_starttag(self, tag, attrs):
-        if tag != 'a':
-            return
-        url_parts = None
-        python_specifier = packaging_specifiers.SpecifierSet('')
-        for attr, value in attrs:
-            if attr == 'href':
-                url_parts = six.moves.urllib_parse.urlsplit(value)
-                replacements = {
-                    fn: part
-                    for fn, part in zip(url_parts._fields, url_parts)
-                    if part or fn == 'fragment'
-                }
-                url_parts = self.base_url_parts._replace(**replacements)
-            elif attr == 'data-requires-python':
-                python_specifier = packaging_specifiers.SpecifierSet(value)
-        if not url_parts:
-            return
-        try:
-            link = parse_link(url_parts, python_specifier)
-        except UnwantedLink:
-            return
-        self.links.append(link)
+
+def _parse_anchor(base_url_parts, href, requires_python):
+    """Build a page entry from an anchor's attributes.
+
+    Returns `None` if the anchor does not point to an artifact we want.
+    """
+    if not href:
+        return None
+    url_parts = six.moves.urllib_parse.urlsplit(href)
+    try:
+        klass, file_stem, file_extension = split_filename(
+            url_parts.path.rsplit('/', 1)[-1],
+        )
+    except UnwantedLink:
+        return None
+    checksum = url_parts.fragment
+    replacements = {
+        fn: part
+        for fn, part in zip(url_parts._fields, url_parts)
+        if part
+    }
+    replacements['fragment'] = ''
+    return PageEntry(
+        klass=klass,
+        url_parts=base_url_parts._replace(**replacements),
+        checksum=checksum,
+        file_stem=file_stem,
+        file_extension=file_extension,
+        python_specifier=_parse_python_specifier(requires_python or ''),
+        version=klass.parse_version(file_stem),
+    )
+
+
+def _iter_anchor_attributes(text):
+    for anchor_match in _ANCHOR_RE.finditer(text):
+        content = anchor_match.group(1)
+        if content is None:     # This is a comment.
+            continue
+        attrs = {}
+        for match in _ATTRIBUTE_RE.finditer(content):
+            name, dquoted, squoted, unquoted = match.groups()
+            value = dquoted or squoted or unquoted or ''
+            attrs[name.lower()] = unescape(value)
+        yield attrs
+
+
+def parse_page(base_url, response):
+    """Scrap artifacts from a simple API page response.
+
+    Returns a list of `PageEntry` instances.
+    """
+    base_url_parts = six.moves.urllib_parse.urlsplit(base_url)
+    entries = []
+    for attrs in _iter_anchor_attributes(response.text):
+        entry = _parse_anchor(
+            base_url_parts,
+            attrs.get('href'), attrs.get('data-requires-python'),
+        )
+        if entry is not None:
+            entries.append(entry)
+    return entries
 
 
 PYPI_PAGE_CACHE_SIZE = 64   # Should be reasonable?
 
+PREFETCH_WORKERS = 8
 
-def _link_sort_key(link):
-    try:
-        is_binary_compatible = link.is_binary_compatible
-    except AttributeError:
-        return 0
-    return 1 if is_binary_compatible() else -1
+
+_link_sort_key = operator.attrgetter('sort_rank')
 
 
 def _get_dependencies_from(link, extras, offline):
@@ -66,25 +143,55 @@ class IndexServer(object):
 
     def __init__(self, base_url):
         self.base_url = base_url
+        self._session = get_session()
 
     @lru_cache(maxsize=PYPI_PAGE_CACHE_SIZE)
-    def _get_package_links(self, package):
-        """Get links on a simple API page.
+    def _get_package_entries(self, package):
+        """Get artifact entries on a simple API page.
+
+        Returns a dict mapping each version to a list of its entries, so
+        lookups by version don't need to scan the whole page.
         """
         url = posixpath.join(self.base_url, package)
-        response = requests.get(url)
+        response = self._session.get(url)
         if response.status_code == 404:
             raise PackageNotFound(package)
         elif not response.ok:
             raise APIError(response.reason)
-        parser = SimplePageParser(base_url=self.base_url)
-        parser.feed(response.text)
-        return parser.links
+        versioned_entries = {}
+        for entry in parse_page(self.base_url, response):
+            versioned_entries.setdefault(entry.version, []).append(entry)
+        return versioned_entries
+
+    def _try_get_package_entries(self, package):
+        try:
+            self._get_package_entries(package)
+        except (APIError, requests.RequestException):
+            pass
+
+    def prefetch(self, packages):
+        """Fetch simple API pages of packages concurrently.
+
+        Pages are stored in the page cache, so later lookups of the packages
+        don't need to hit the network. Errors are ignored here, and raised
+        when the package is actually looked up.
+
+        This does nothing if the page cache is not available (Python 2),
+        since the fetched pages would just be thrown away.
+        """
+        if not HAS_LRU_CACHE:
+            return
+        pool = multiprocessing.pool.ThreadPool(PREFETCH_WORKERS)
+        try:
+            pool.map(self._try_get_package_entries, packages)
+        finally:
+            pool.close()
+            pool.join()
 
     def _get_links(self, candidate):
+        entries = self._get_package_entries(candidate.name)
         return sorted((
-            link for link in self._get_package_links(candidate.name)
-            if link.info.version == candidate.version
+            entry.as_link() for entry in entries.get(candidate.version, ())
         ), key=_link_sort_key)
 
     def get_dependencies(self, candidate, offline=False):
@@ -106,6 +213,6 @@ class IndexServer(object):
         Returns a collection of `Candidate` instances.
         """
         return set(
-            Candidate.pin_from(requirement, link.info.version)
-            for link in self._get_package_links(requirement.name)
+            Candidate.pin_from(requirement, version)
+            for version in self._get_package_entries(requirement.name)
         )
@@ -1,6 +1,5 @@
 import collections
-import functools
-import hashlib
+import re
 import sys
 import warnings
 
@@ -9,9 +8,31 @@ from pip._vendor.distlib.wheel import Wheel
 from pip._vendor.packaging import version as packaging_version
 from wheel import pep425tags
 
+from ._compat.functools import lru_cache
+from .utils import ChecksumVerifier
 from .wheels import get_built_wheel_path, get_wheel_path
 
 
+# The interpreter doesn't change during a run, so compute this only once.
+if sys.platform.startswith('win'):
+    with warnings.catch_warnings():
+        # Ignore "Python ABI tag may be incorrect" warnings on Windows.
+        # Windows wheels don't specify those anyway.
+        warnings.simplefilter('ignore')
+        _SUPPORTED_TAGS = frozenset(pep425tags.get_supported())
+else:
+    _SUPPORTED_TAGS = frozenset(pep425tags.get_supported())
+
+
+# The same version appears many times on a page, once for each artifact.
+VERSION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=VERSION_CACHE_SIZE)
+def _parse_version(s):
+    return packaging_version.parse(s)
+
+
 class WheelNotFoundError(OSError):
     pass
 
@@ -21,7 +42,12 @@ class Link(object):
 
     Links are usually found in a Simple API page, but can also be specified
     directly in a Requirement with PEP 508's URL-based lookup.
+
+    `sort_rank` is used to order links of the same version. It is computed
+    on construction so sorting does not need to call into each link.
     """
+    sort_rank = 0
+
     def __init__(
             self, url, checksum,
             file_stem, file_extension,
@@ -43,20 +69,27 @@ class Link(object):
     def filename(self):
         return self.file_stem + self.extension
 
+    @classmethod
+    def parse_version(cls, file_stem):
+        """Parse the version out of a file stem.
+
+        This is cheaper than building a link and reading `info.version`, so
+        it can be used to filter artifacts before constructing links.
+        """
+        raise NotImplementedError
+
     def parse_for_info(self):
         raise NotImplementedError
 
-    def check_download(self, data):
-        """Check if the downloaded data is good.
+    def get_download_verifier(self):
+        """Get a verifier to check if the downloaded data is good.
+
+        Returns `None` if the link does not have a checksum.
         """
         if not self.checksum:
-            return
+            return None
         htype, hvalue = self.checksum.split('=')
-        h = hashlib.new(htype)
-        h.update(data)
-        value = h.hexdigest()
-        if hvalue != value:
-            raise ValueError('expected {}, but got {}'.format(hvalue, value))
+        return ChecksumVerifier(htype, hvalue)
 
     def as_wheel(self, offline=False):
         """Build a representation of a local wheel artifact with the link.
@@ -77,9 +110,13 @@ SourceInformation = collections.namedtuple('SourceInformation', [
 class SourceDistributionLink(Link):
     """Link to an sdist.
     """
+    @classmethod
+    def parse_version(cls, file_stem):
+        return _parse_version(file_stem.rsplit('-', 1)[-1])
+
     def parse_for_info(self):
         name, ver = self.file_stem.rsplit('-', 1)
-        return SourceInformation(name, packaging_version.parse(ver))
+        return SourceInformation(name, _parse_version(ver))
 
     def as_wheel(self, offline=False):
         if offline:     # TODO: Can we peek into the wheel cache here?
@@ -103,6 +140,14 @@ WheelInformation = collections.namedtuple('WheelInformation', [
 class WheelDistributionLink(Link):
     """Link to a wheel.
     """
+    def __init__(self, *args, **kwargs):
+        super(WheelDistributionLink, self).__init__(*args, **kwargs)
+        self.sort_rank = 1 if self.is_binary_compatible() else -1
+
+    @classmethod
+    def parse_version(cls, file_stem):
+        return _parse_version(file_stem.split('-', 2)[1])
+
     def parse_for_info(self):
         """Parse the wheel's file name according to PEP427.
 
@@ -115,24 +160,16 @@ class WheelDistributionLink(Link):
         elif len(parts) == 5:
             name, ver, impl, abi, plat = parts
             build = None
-        version = packaging_version.parse(ver)
+        version = _parse_version(ver)
         return WheelInformation(name, version, build, impl, abi, plat)
 
     def is_binary_compatible(self):
-        with warnings.catch_warnings():
-            # Ignore "Python ABI tag may be incorrect" warnings on Windows.
-            # Windows wheels don't specify those anyway.
-            if sys.platform.startswith('win'):
-                warnings.simplefilter('ignore')
-            supported_tags = pep425tags.get_supported()
         wheel_tag = (
             self.info.language_implementation_tag,
             self.info.abi_tag,
             self.info.platform_tag,
         )
-        if wheel_tag not in supported_tags:
-            return False
-        return True
+        return wheel_tag in _SUPPORTED_TAGS
 
     def as_wheel(self, offline=False):
         path = get_wheel_path(self, offline)
@@ -154,20 +191,43 @@ WANTED_EXTENSIONS = [
 ]
 
 
-def _select_link_klass(filename):
+_EXTENSION_KLASSES = dict(WANTED_EXTENSIONS)
+
+_EXTENSION_RE = re.compile(r'^(?P<stem>.+?)(?P<ext>{})$'.format(
+    '|'.join(re.escape(ext) for ext, _ in WANTED_EXTENSIONS),
+))
+
+
+def split_filename(filename):
     """Parse the file name to recognize an artifact type.
 
     This is important because we need to somehow handle the sdist .tar.gz
     extension. We also exclude packages we don't want here.
+
+    Returns a 3-tuple `(klass, file_stem, file_extension)`, where `klass` is
+    the link class to represent the artifact.
     """
-    for ext, klass in WANTED_EXTENSIONS:
-        if filename.endswith(ext):
-            return functools.partial(
-                klass,
-                file_stem=filename[:-len(ext)],
-                file_extension=ext,
-            )
-    raise UnwantedLink(filename)
+    match = _EXTENSION_RE.match(filename)
+    if not match:
+        raise UnwantedLink(filename)
+    ext = match.group('ext')
+    return _EXTENSION_KLASSES[ext], match.group('stem'), ext
+
+
+def build_link(url_parts, checksum, python_specifier):
+    """Build a link from an already-split URL.
+
+    `url_parts` is a `SplitResult` without the fragment; the checksum is
+    passed separately.
+    """
+    klass, file_stem, file_extension = split_filename(
+        url_parts.path.rsplit('/', 1)[-1],
+    )
+    return klass(
+        url=six.moves.urllib_parse.urlunsplit(url_parts),
+        checksum=checksum, python_specifier=python_specifier,
+        file_stem=file_stem, file_extension=file_extension,
+    )
 
 
 def parse_link(url, python_specifier):
@@ -175,11 +235,6 @@ def parse_link(url, python_specifier):
         parts = six.moves.urllib_parse.urlsplit(url)
     else:
         parts = url
-    checksum = parts.fragment
-    parts = parts._replace(fragment='')
-
-    klass = _select_link_klass(parts.path.rsplit('/', 1)[-1])
-    return klass(
-        url=six.moves.urllib_parse.urlunsplit(parts),
-        checksum=checksum, python_specifier=python_specifier,
+    return build_link(
+        parts._replace(fragment=''), parts.fragment, python_specifier,
     )
@@ -0,0 +1,16 @@
+__all__ = ['SafeFileCache']
+
+import sys
+
+from pip._vendor import six
+
+from ._not import from_pip_import
+
+try:
+    SafeFileCache = from_pip_import('network.cache', 'SafeFileCache')
+except ImportError:     # pip<20 keeps it in the download module.
+    exc_info = sys.exc_info()
+    try:
+        SafeFileCache = from_pip_import('download', 'SafeFileCache')
+    except ImportError:
+        six.reraise(*exc_info)
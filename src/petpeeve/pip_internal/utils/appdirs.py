@@ -0,0 +1,3 @@
+from .._not import from_pip_import
+
+user_cache_dir = from_pip_import('utils.appdirs', 'user_cache_dir')
@@ -1,4 +1,5 @@
 import collections
+import copy
 import re
 import warnings
 
@@ -6,6 +7,8 @@ from pip._vendor import six
 from pip._vendor.packaging.markers import Marker
 from pip._vendor.packaging.requirements import Requirement as BaseRequirement
 
+from ._compat.functools import lru_cache
+
 
 # I heard Warehouse and Wheel always put the extra marker at the end, and the
 # operator is always ==, so we cheat a little (a lot?) here.
@@ -38,15 +41,13 @@ class Requirement(BaseRequirement):
         `Requirement` instance, and the second the extra's name. If no extra is
         detected, the second member will be `None`.
         """
-        requirement = cls(s)
-        if not requirement.marker:  # Short circuit to favour the common case.
-            return requirement, None
+        # Match before parsing, so each string only needs to be parsed once.
         match = EXTRA_RE.match(s)
-        if not match:   # No final "extra" expression, yay.
-            return requirement, None
+        if not match or ';' not in match.group('requirement'):
+            return cls(s), None     # No final "extra" expression, yay.
         extra = match.group('extra')
         if not extra:
-            return requirement, None
+            return cls(s), None
         s = match.group('requirement').rstrip()
         if s.endswith('and'):
             s = s[:-3].rstrip()
@@ -54,11 +55,70 @@ class Requirement(BaseRequirement):
             s = s[:-1].rstrip()
         return cls(s), extra
 
+    def with_marker(self, marker):
+        """Return a copy of this requirement, with the marker replaced.
+        """
+        requirement = copy.copy(self)
+        requirement.marker = marker
+        try:
+            del requirement._key
+        except AttributeError:
+            pass
+        return requirement
+
+    def _get_key(self):
+        # Building the string is expensive, so only do it once. This is safe
+        # because a requirement must not be mutated after it's hashed anyway.
+        try:
+            return self._key
+        except AttributeError:
+            self._key = str(self)
+        return self._key
+
     def __hash__(self):
-        return hash(str(self))
+        return hash(self._get_key())
 
     def __eq__(self, other):
-        return str(self) == str(other)
+        if isinstance(other, Requirement):
+            return self._get_key() == other._get_key()
+        return self._get_key() == str(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+
+# The same requirement strings show up again and again across distributions.
+REQUIREMENT_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=REQUIREMENT_CACHE_SIZE)
+def _parse_requirement(s):
+    """Cached `Requirement.parse`.
+
+    The results are shared, so they must not be mutated.
+    """
+    return Requirement.parse(s)
+
+
+# Metadata usually only has a handful of distinct environments.
+MARKER_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=MARKER_CACHE_SIZE)
+def _parse_marker(s):
+    return Marker(s)
+
+
+@lru_cache(maxsize=MARKER_CACHE_SIZE)
+def _combine_markers(environment, marker):
+    return Marker('({}) and ({})'.format(environment, marker))
+
+
+def _add_requirement(requirement, extra, base, extras):
+    if extra:
+        extras[extra].add(requirement)
+    else:
+        base.add(requirement)
 
 
 def _add_requires(entry, base, extras):
@@ -73,19 +133,14 @@ def _add_requires(entry, base, extras):
     environment = entry.get('environment')
     e_extra = entry.get('extra')
     for s in requires:
-        r, r_extra = Requirement.parse(s)
+        r, r_extra = _parse_requirement(s)
         if environment:
             if r.marker:
-                m = Marker('({}) and ({})'.format(environment, r.marker))
+                m = _combine_markers(environment, str(r.marker))
             else:
-                m = Marker(environment)
-            r.marker = m
-        if not e_extra and not r_extra:
-            base.add(r)
-        elif e_extra:
-            extras[e_extra].add(r)
-        elif r_extra:
-            extras[r_extra].add(r)
+                m = _parse_marker(environment)
+            r = r.with_marker(m)
+        _add_requirement(r, e_extra or r_extra, base, extras)
 
 
 class RequirementSpecification(object):
@@ -102,7 +157,7 @@ class RequirementSpecification(object):
 
     @classmethod
     def empty(cls):
-        return cls([], {})
+        return cls(set(), {})
 
     @classmethod
     def from_wheel(cls, wheel):
@@ -128,19 +183,19 @@ class RequirementSpecification(object):
         base = set()
         extras = collections.defaultdict(set)
         for s in requires_dist:
-            requirement, extra = Requirement.parse(s)
-            if not extra:
-                base.add(requirement)
-            else:
-                extra_reqs = extras[extra]
-                extra_reqs.add(requirement)
-                extras[extra] = extra_reqs
+            requirement, extra = _parse_requirement(s)
+            _add_requirement(requirement, extra, base, extras)
         return cls(base, extras)
 
     def get_dependencies(self, extras):
-        deps = set(self.base)
+        """Get dependencies of the distribution, including given extras.
+
+        The returned collection must not be modified. It may be the same
+        object as `self.base`.
+        """
         if not extras:
-            return deps
+            return self.base
+        deps = set(self.base)
         for extra in extras:
             try:
                 extra_deps = self.extras[extra]
@@ -1,4 +1,5 @@
 import atexit
+import hashlib
 import os
 import shutil
 import tempfile
@@ -8,19 +9,34 @@ class DownloadIntegrityError(ValueError):
     pass
 
 
-def download_file(url, filename=None, container=None, check=None):
+DOWNLOAD_CHUNK_SIZE = 2 ** 16
+
+
+class ChecksumVerifier(object):
+    """Hash downloaded data chunk by chunk, and check it against a value.
+    """
+    def __init__(self, htype, hvalue):
+        self._hash = hashlib.new(htype)
+        self._expected = hvalue
+
+    def update(self, chunk):
+        self._hash.update(chunk)
+
+    def verify(self):
+        value = self._hash.hexdigest()
+        if value != self._expected:
+            raise ValueError('expected {}, but got {}'.format(
+                self._expected, value,
+            ))
+
+
+def download_file(url, filename=None, container=None, verifier=None):
     from pip._vendor import requests
     response = requests.get(url, stream=True)
     response.raise_for_status()
 
     if not filename:
         filename = url.rsplit('/', 1)[-1]
-    data = response.content
-    if callable(check):
-        try:
-            check(data)
-        except ValueError as e:
-            raise DownloadIntegrityError(str(e))
     if container is None:
         container = tempfile.mkdtemp()
         atexit.register(shutil.rmtree, container, ignore_errors=True)
@@ -28,11 +44,25 @@ def download_file(url, filename=None, container=None, check=None):
         os.makedirs(container)
     path = os.path.join(container, filename)
     with open(path, 'wb') as f:
-        f.write(data)
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            if verifier is not None:
+                verifier.update(chunk)
+    if verifier is not None:
+        try:
+            verifier.verify()
+        except ValueError as e:
+            os.remove(path)
+            raise DownloadIntegrityError(str(e))
     return path
 
 
 def is_version_specified(specifier, version):
-    for _ in specifier.filter([version]):
-        return True
-    return False
+    # Same as checking filter([version]), without creating a generator. An
+    # empty set lets a lone pre-release through unless they are explicitly
+    # disallowed; otherwise pre-releases need to be opted into.
+    if len(specifier):
+        return specifier.contains(version)
+    return specifier.contains(
+        version, prereleases=(specifier.prereleases is not False),
+    )
@@ -51,7 +51,8 @@ def get_wheel_path(link, offline):
     elif offline:
         return None
     downloaded_path = download_file(
-        link.url, filename=link.filename, check=link.check_download,
+        link.url, filename=link.filename,
+        verifier=link.get_download_verifier(),
     )
     if not os.path.exists(cache_dir):
         os.makedirs(cache_dir)
@@ -63,7 +64,8 @@ def get_built_wheel_path(link):
     """Download an sdist from link, and build a wheel out of it.
     """
     sdist_path = download_file(
-        link.url, filename=link.filename, check=link.check_download,
+        link.url, filename=link.filename,
+        verifier=link.get_download_verifier(),
     )
     container = os.path.dirname(sdist_path)
 
@@ -0,0 +1,36 @@
+from petpeeve.indexes.simpleapi import parse_page
+
+
+PAGE = """<!DOCTYPE html>
+<html>
+  <body>
+    <h1>Links for foo</h1>
+    <a href="/p/foo-1.5.tar.gz" data-requires-python=">=3.7">foo-1.5.tar.gz</a>
+    <a data-requires-python=">=3.6" href="/p/foo-1.0.tar.gz">foo-1.0.tar.gz</a>
+    <!-- <a href="/p/foo-0.1.tar.gz">foo-0.1.tar.gz</a> -->
+    <a href='/p/foo-2.0-py3-none-any.whl#sha256=abc'
+       data-requires-python="&gt;=3.8">foo-2.0-py3-none-any.whl</a>
+    <a href="/p/foo-2.0.exe">foo-2.0.exe</a>
+  </body>
+</html>
+"""
+
+
+class FakeResponse(object):
+    def __init__(self, text):
+        self.text = text
+
+
+def test_parse_page():
+    entries = parse_page(
+        'https://example.com/simple/', FakeResponse(PAGE),
+    )
+    assert [
+        (e.file_stem, e.file_extension, str(e.python_specifier), e.checksum)
+        for e in entries
+    ] == [
+        ('foo-1.5', '.tar.gz', '>=3.7', ''),
+        ('foo-1.0', '.tar.gz', '>=3.6', ''),
+        ('foo-2.0-py3-none-any', '.whl', '>=3.8', 'sha256=abc'),
+    ]
+    assert entries[0].as_link().url == 'https://example.com/p/foo-1.5.tar.gz'